@@ -7,12 +7,265 @@ to automatically identify and extract propaganda patterns, then updates
 the propaganda_patterns_data.json file.
 """
 
+import atexit
+import copy
+import hashlib
 import json
+import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 import re
+import sys
+
+log = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json is used as a fallback
+    orjson = None
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Cheap admission filter: names and themes that virtually every article worth
+# analyzing mentions. Markers are per source language - articles in any other
+# (or an unknown) language always go to the LLM. English markers are regex
+# fragments matched as whole words; for the inflected languages they are literal
+# stems matched at the start of a word.
+_ENGLISH_MARKERS = [
+    r"nato", r"ukrain(?:e|ian|ians)?", r"kyiv", r"kiev", r"zelensk(?:y|yy|iy)",
+    r"russia(?:n|ns)?", r"russophob(?:e|es|ia|ic)", r"kremlin", r"putin", r"moscow",
+    r"sanctions?", r"west", r"western(?:ers?)?", r"(?:neo-?)?nazis?", r"fascis(?:t|ts|m)",
+    r"soviets?", r"usa", r"united states", r"washington", r"pentagon", r"brussels",
+    r"european union", r"donbas+", r"crimea(?:n)?", r"belarus(?:ian)?",
+    r"lukashenk[oa]", r"hegemon(?:y|ic)?", r"multipolar(?:ity)?", r"provocations?",
+    r"escalat(?:e|ed|es|ing|ion)", r"wars?", r"warfare", r"propaganda",
+]
+PROPAGANDA_MARKERS = {
+    "polish": [
+        "nato", "ukrai", "kijow", "kijów", "zełensk", "zelensk", "rosj", "rosyj",
+        "kreml", "putin", "moskw", "sankcj", "zachod", "zachód", "nazis", "faszys",
+        "usa", "ameryk", "waszyngton", "bruksel", "unia europejsk", "unii europejsk",
+        "donbas", "krym", "białoru", "bialoru", "łukaszenk", "hegemon",
+        "wielobiegun", "prowokac", "eskalac", "wojn", "propagand", "rusofob",
+    ],
+    "russian": [
+        "нато", "украин", "киев", "зеленск", "росси", "русск", "русофоб", "кремл",
+        "путин", "москв", "санкц", "запад", "нацис", "фашис", "сша", "америк",
+        "вашингтон", "брюссел", "евросоюз", "донбас", "крым", "белорус",
+        "лукашенк", "гегемон", "многополяр", "провокац", "эскалац", "войн", "пропаганд",
+    ],
+    "spanish": [
+        "otan", "nato", "ucran", "kiev", "kyiv", "zelensk", "rusi", "ruso", "rusa",
+        "rusofob", "kreml", "putin", "moscú", "moscu", "sancion", "occident", "nazi",
+        "fascis", "soviét", "soviet", "eeuu", "estados unidos", "washington",
+        "bruselas", "unión europea", "union europea", "donbás", "donbas", "crimea",
+        "bielorrus", "lukashenk", "hegemon", "multipolar", "provocac", "escalad",
+        "guerra", "propaganda",
+    ],
+    "czech": [
+        "nato", "ukrajin", "kyjev", "kyjiv", "zelensk", "rusk", "rusov", "rusofob",
+        "kreml", "putin", "moskv", "sankc", "západ", "zapad", "nacis", "fašis",
+        "fasis", "sssr", "usa", "americ", "washington", "brusel", "evropsk",
+        "donbas", "krym", "bělorus", "belorus", "lukašenk", "hegemon", "multipolár",
+        "provokac", "eskalac", "válk", "valk", "propagand",
+    ],
+    "hungarian": [
+        "nato", "ukrajn", "ukrán", "ukran", "kijev", "zelenszk", "orosz", "fehérorosz",
+        "kreml", "putyin", "putin", "moszkv", "szankci", "nyugat", "náci", "naci",
+        "fasiszt", "szovjet", "usa", "amerik", "washington", "brüsszel", "európai unió",
+        "donbasz", "krím", "krim", "lukasenk", "hegemón", "hegemon", "többpólus",
+        "provokáci", "eszkalác", "háború", "propagand",
+    ],
+    "serbian": [
+        # Cyrillic
+        "нато", "украј", "кијев", "зеленск", "русиј", "руск", "кремљ", "путин",
+        "москв", "санкциј", "запад", "нацис", "фашис", "америк", "вашингтон",
+        "брисел", "донбас", "крим", "белорус", "лукашенк", "хегемон", "мултиполар",
+        "провокациј", "ескалациј", "рат", "пропаганд",
+        # Latin
+        "nato", "ukrajin", "kijev", "zelensk", "rusij", "rusk", "kremlj", "putin",
+        "moskv", "sankcij", "zapad", "nacis", "fašis", "amerik", "vašington",
+        "brisel", "donbas", "krim", "belorus", "lukašenk", "hegemon", "multipolar",
+        "provokacij", "eskalacij", "rat", "propagand",
+    ],
+}
+_MARKER_LANGUAGE_ALIASES = {
+    "en": "english", "eng": "english",
+    "pl": "polish", "polski": "polish",
+    "ru": "russian", "русский": "russian",
+    "es": "spanish", "español": "spanish", "espanol": "spanish",
+    "cs": "czech", "cz": "czech", "čeština": "czech", "cestina": "czech",
+    "hu": "hungarian", "magyar": "hungarian",
+    "sr": "serbian", "srpski": "serbian", "српски": "serbian",
+}
+PROPAGANDA_MARKER_RES = {
+    language: re.compile(r"\b(?:" + "|".join(re.escape(m) for m in markers) + ")", re.IGNORECASE)
+    for language, markers in PROPAGANDA_MARKERS.items()
+}
+PROPAGANDA_MARKER_RES["english"] = re.compile(
+    r"\b(?:" + "|".join(_ENGLISH_MARKERS) + r")\b", re.IGNORECASE
+)
+
+# Accepted answers at the interactive prompts (compared after strip().lower())
+_YES_ANSWERS = frozenset({"y", "yes"})
+_NO_ANSWERS = frozenset({"n", "no"})
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+_END_MARKERS = frozenset({"end", "done", "finish"})
+_ENGLISH_LANGUAGES = frozenset({"english", "en"})
+
+# Console separators, built once rather than on every loop iteration
+_RULE_WIDE = "=" * 70
+_RULE = "=" * 50
+_THIN_RULE = "─" * 50
+_DOUBLE_RULE = "═" * 50
+
+def _to_text(value) -> str:
+    """Render a JSON value as text: strings as-is, containers as compact JSON."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return _json_dumps(value).decode('utf-8')
+    return str(value)
+
+class LLMScores(BaseModel):
+    """Scores block of an LLM analysis; any extra score keys are kept."""
+    model_config = ConfigDict(extra="allow")
+    
+    russian_alignment: Union[int, float] = 0
+    sophistication: Union[int, float] = 0
+    effectiveness: Union[int, float] = 0
+    
+    @field_validator("russian_alignment", "sophistication", "effectiveness", mode="before")
+    @classmethod
+    def _number_or_zero(cls, value):
+        # Accept numbers and numeric text such as "3" or "3/5"; anything else scores 0
+        if isinstance(value, bool):
+            return 0
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, str):
+            match = re.match(r"\s*(\d+(?:\.\d+)?)", value)
+            if match:
+                number = float(match.group(1))
+                return int(number) if number.is_integer() else number
+        return 0
+
+class LLMAnalysis(BaseModel):
+    """Schema of the JSON analysis the LLM is asked to return.
+    
+    Validation is lenient in the same way the old hand-written checks were:
+    missing fields get defaults, non-list list fields become empty lists and a
+    non-object scores block is replaced by zero scores. List items and text
+    fields are coerced to strings and scores to numbers, so the stored analysis
+    always has the declared shape.
+    """
+    translation: Optional[str] = None
+    primary_narrative: str = "UNKNOWN"
+    techniques: List[str] = Field(default_factory=list)
+    key_phrases: List[str] = Field(default_factory=list)
+    emotional_appeals: List[str] = Field(default_factory=list)
+    target_audience: str = "Unknown"
+    scores: LLMScores = Field(default_factory=LLMScores)
+    analysis_notes: str = ""
+    
+    @field_validator("techniques", "key_phrases", "emotional_appeals", mode="before")
+    @classmethod
+    def _string_list(cls, value):
+        if not isinstance(value, list):
+            return []
+        return [_to_text(item) for item in value if item is not None]
+    
+    @field_validator("scores", mode="before")
+    @classmethod
+    def _scores_or_default(cls, value):
+        return value if isinstance(value, dict) else {}
+    
+    @field_validator("translation", mode="before")
+    @classmethod
+    def _optional_text(cls, value):
+        return None if value is None else _to_text(value)
+    
+    @field_validator("primary_narrative", "target_audience", "analysis_notes", mode="before")
+    @classmethod
+    def _text(cls, value, info):
+        if value is None:
+            return cls.model_fields[info.field_name].default
+        return _to_text(value)
+
+class LLMCache:
+    """Exact-match cache of validated LLM results, persisted as a JSON file.
+    
+    Only deterministic (temperature 0) requests should be cached - with sampling
+    enabled the same prompt legitimately produces different answers.
+    """
+    
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load()
+    
+    def _load(self) -> Dict:
+        """Load cached results, starting empty if the file is missing or unreadable."""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (json.JSONDecodeError, OSError) as e:
+            log.warning(f"Warning: Ignoring unreadable LLM cache {self.cache_file}: {e}")
+            return {}
+    
+    @staticmethod
+    def make_key(model_name: str, messages: List[Dict], temperature: float) -> str:
+        """Build a stable cache key from everything that determines the response."""
+        key_source = json.dumps(
+            {"model": model_name, "messages": messages, "temperature": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached result for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+        return copy.deepcopy(value) if value is not None else None
+    
+    def set(self, key: str, value: Dict):
+        """Store a result; it is written to disk on the next save()."""
+        with self._lock:
+            self._entries[key] = copy.deepcopy(value)
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache to disk if anything changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                self._dirty = False
+            except (OSError, TypeError, ValueError) as e:
+                log.warning(f"⚠️  Could not save LLM cache {self.cache_file}: {e}")
 
 class LLMPropagandaExtractor:
     """Extract propaganda patterns using local LLM analysis."""
@@ -20,12 +273,66 @@ class LLMPropagandaExtractor:
     def __init__(self, 
                  lm_studio_url: str = "http://localhost:1234/v1/chat/completions",
                  model_name: str = "local-model",
-                 data_file: str = "propaganda_patterns_data.json"):
+                 data_file: str = "propaganda_patterns_data.json",
+                 temperature: float = 0.1,
+                 use_cache: bool = True,
+                 rewrite_every: int = 20,
+                 stream: bool = True,
+                 max_inflight: int = 4,
+                 prefilter: bool = True,
+                 batch_size: int = 16):
         self.lm_studio_url = lm_studio_url
         self.model_name = model_name
+        self.temperature = temperature
+        self.stream = stream
+        self._system_prompt = self.create_system_prompt()
+        # LLM requests run in the background so the next article can be entered meanwhile
+        self.max_inflight = max_inflight
+        self.batch_size = batch_size
+        self.prefilter = prefilter
+        self._llm_pool = ThreadPoolExecutor(max_workers=max_inflight)
         self.data_file = Path(data_file)
         self.data = self.load_data()
         
+        # New entries are appended to a JSONL journal and the full data file is only
+        # rewritten every `rewrite_every` entries (and at exit), instead of per article
+        self.journal_file = self.data_file.with_name(self.data_file.name + ".jsonl")
+        self.rewrite_every = rewrite_every
+        self._unsaved_entries = self._replay_journal()
+        # Exact-duplicate index: content hash -> analyzed entry. Entries the pre-filter
+        # recorded without analysis are tracked separately so the same text can still
+        # be analyzed later (e.g. with --no-prefilter or a human analysis)
+        self._seen = {}
+        self._prefiltered_hashes = set()
+        for entry in self.data["entries"]:
+            self._index_entry(entry)
+        # Opened on the first journaled entry, so modes that add none leave no file behind
+        self._journal = None
+        self._journal_lock = threading.Lock()
+        self._closed = False
+        # Periodic rewrites run on a single background writer so they never block input
+        self._io = ThreadPoolExecutor(max_workers=1)
+        self._save_future = None
+        atexit.register(self.close)
+        
+        # Responses are only reproducible (and therefore cacheable) at temperature 0
+        self.cache = LLMCache(self.data_file.with_suffix('.cache.json')) if use_cache else None
+        self.session = self._create_session(max(max_inflight, batch_size))
+        self._health_ok = False
+        
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """Create a pooled Keep-Alive session holding pool_size connections per host."""
+        self._pool_size = pool_size
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+        
     def load_data(self) -> Dict:
         """Load existing propaganda patterns data or create new structure."""
         if self.data_file.exists():
@@ -35,16 +342,16 @@ class LLMPropagandaExtractor:
                 
                 # Validate structure and repair if needed
                 if not isinstance(data, dict):
-                    print(f"Warning: Invalid JSON structure in {self.data_file}, creating new structure")
+                    log.warning(f"Warning: Invalid JSON structure in {self.data_file}, creating new structure")
                     return self._create_new_structure()
                 
                 # Ensure required keys exist
                 if "entries" not in data:
-                    print("Warning: Missing 'entries' key, adding it")
+                    log.warning("Warning: Missing 'entries' key, adding it")
                     data["entries"] = []
                 
                 if "metadata" not in data:
-                    print("Warning: Missing 'metadata' key, adding it")
+                    log.warning("Warning: Missing 'metadata' key, adding it")
                     data["metadata"] = {
                         "created": datetime.datetime.now().isoformat(),
                         "extraction_method": "LLM-powered"
@@ -52,29 +359,113 @@ class LLMPropagandaExtractor:
                 
                 # Ensure entries is a list
                 if not isinstance(data["entries"], list):
-                    print("Warning: 'entries' is not a list, converting")
+                    log.warning("Warning: 'entries' is not a list, converting")
                     data["entries"] = []
                 
                 return data
                 
             except json.JSONDecodeError as e:
-                print(f"Error: Corrupted JSON in {self.data_file}: {e}")
-                print("Creating backup and starting fresh...")
+                log.error(f"Error: Corrupted JSON in {self.data_file}: {e}")
+                log.info("Creating backup and starting fresh...")
                 
                 # Create backup of corrupted file
                 backup_path = self.data_file.with_suffix('.corrupted.bak')
                 import shutil
                 shutil.copy2(self.data_file, backup_path)
-                print(f"Corrupted file backed up to: {backup_path}")
+                log.error(f"Corrupted file backed up to: {backup_path}")
                 
                 return self._create_new_structure()
                 
             except Exception as e:
-                print(f"Unexpected error loading {self.data_file}: {e}")
+                log.error(f"Unexpected error loading {self.data_file}: {e}")
                 return self._create_new_structure()
         else:
             return self._create_new_structure()
     
+    def _replay_journal(self) -> int:
+        """Recover entries journaled after the last full save; returns how many were added."""
+        if not self.journal_file.exists():
+            return 0
+        
+        known_ids = {entry.get("id") for entry in self.data["entries"]}
+        recovered = 0
+        
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = _json_loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    log.warning(f"Warning: Skipping unreadable line in {self.journal_file}")
+                    continue
+                if entry.get("id") in known_ids:
+                    continue
+                self.data["entries"].append(entry)
+                known_ids.add(entry.get("id"))
+                recovered += 1
+        
+        if recovered:
+            log.info(f"✓ Recovered {recovered} unsaved entries from {self.journal_file}")
+        return recovered
+    
+    def _record_entry(self, entry: Dict):
+        """Journal a new entry, rewriting the full data file every `rewrite_every` entries."""
+        with self._journal_lock:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a', encoding='utf-8', buffering=1)
+            self._journal.write(_json_dumps(entry).decode('utf-8') + "\n")
+        self._unsaved_entries += 1
+        
+        if self._unsaved_entries >= self.rewrite_every:
+            self.save_data_async()
+    
+    def _reset_journal(self, saved_up_to_id: Optional[int] = None):
+        """Drop journaled entries once they are safely in the data file.
+        
+        With saved_up_to_id, entries journaled after that snapshot are kept.
+        """
+        with self._journal_lock:
+            if self._journal is None:
+                # Nothing journaled this run; clear what an earlier run left for replay
+                if self.journal_file.exists():
+                    self.journal_file.unlink()
+                return
+            kept_lines = []
+            if saved_up_to_id is not None:
+                self._journal.flush()
+                with open(self.journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            if _json_loads(line).get("id", 0) > saved_up_to_id:
+                                kept_lines.append(line)
+                        except json.JSONDecodeError:
+                            continue
+            self._journal.seek(0)
+            self._journal.truncate()
+            self._journal.writelines(kept_lines)
+    
+    def _wait_for_save(self):
+        """Block until any background save has finished, surfacing its errors."""
+        if self._save_future is not None:
+            self._save_future.result()
+            self._save_future = None
+    
+    def close(self):
+        """Flush any journaled entries into the data file and close the journal."""
+        if self._closed:
+            return
+        self._closed = True
+        self._llm_pool.shutdown(wait=True)
+        self._wait_for_save()
+        if self._unsaved_entries:
+            self.save_data()
+        self._io.shutdown(wait=True)
+        if self._journal is not None:
+            self._journal.close()
+    
     def _create_new_structure(self) -> Dict:
         """Create a new, properly structured data dictionary."""
         return {
@@ -87,38 +478,63 @@ class LLMPropagandaExtractor:
             "entries": []
         }
     
-    def save_data(self):
-        """Save updated data back to JSON file with robust error handling."""
+    def _update_metadata(self):
+        """Refresh the metadata block before the data is written out."""
         self.data["metadata"]["last_updated"] = datetime.datetime.now().isoformat()
         self.data["metadata"]["total_entries"] = len(self.data["entries"])
+        self._unsaved_entries = 0
+    
+    def save_data(self):
+        """Save updated data back to JSON file with robust error handling."""
+        self._wait_for_save()
+        self._update_metadata()
+        self._write_data(self.data)
+    
+    def save_data_async(self):
+        """Save a snapshot of the data on the background writer and return immediately.
+        
+        Saves stay ordered: a new one waits for the previous one to finish first.
+        """
+        self._wait_for_save()
+        self._update_metadata()
+        snapshot = copy.deepcopy(self.data)
+        saved_up_to_id = max((entry.get("id", 0) for entry in snapshot["entries"]), default=0)
+        self._save_future = self._io.submit(self._write_data, snapshot, saved_up_to_id)
+    
+    def _write_data(self, data: Dict, saved_up_to_id: Optional[int] = None):
+        """Write data to the JSON file, then drop the journal entries it now contains."""
+        if self.cache is not None:
+            self.cache.save()
         
         try:
             # Clean data before saving to prevent JSON issues
-            cleaned_data = self._clean_json_data(self.data)
+            cleaned_data = self._clean_json_data(data)
             
             with open(self.data_file, 'w', encoding='utf-8') as f:
                 json.dump(cleaned_data, f, indent=2, ensure_ascii=False)
-            print(f"✓ Updated {self.data_file} with {len(self.data['entries'])} entries")
+            log.info(f"✓ Updated {self.data_file} with {len(data['entries'])} entries")
+            self._reset_journal(saved_up_to_id)
             
         except (TypeError, ValueError, UnicodeEncodeError) as e:
-            print(f"⚠️  JSON serialization error: {e}")
-            print("Creating backup and attempting to save sanitized version...")
+            log.warning(f"⚠️  JSON serialization error: {e}")
+            log.info("Creating backup and attempting to save sanitized version...")
             
             # Create backup of current in-memory data
             backup_path = self.data_file.with_suffix('.error_backup.json')
             try:
                 with open(backup_path, 'w', encoding='utf-8') as f:
                     # Try to save as much as possible, even if malformed
-                    f.write(str(self.data))
-                print(f"Backup saved to: {backup_path}")
+                    f.write(str(data))
+                log.info(f"Backup saved to: {backup_path}")
             except:
-                print("Could not create backup")
+                log.error("Could not create backup")
             
             # Sanitize and save
-            sanitized_data = self._sanitize_json_data(self.data)
+            sanitized_data = self._sanitize_json_data(data)
             with open(self.data_file, 'w', encoding='utf-8') as f:
                 json.dump(sanitized_data, f, indent=2, ensure_ascii=False)
-            print(f"✓ Saved sanitized version with {len(sanitized_data['entries'])} entries")
+            log.info(f"✓ Saved sanitized version with {len(sanitized_data['entries'])} entries")
+            self._reset_journal(saved_up_to_id)
     
     def _clean_json_data(self, data):
         """Recursively clean data to ensure JSON compatibility."""
@@ -165,28 +581,20 @@ class LLMPropagandaExtractor:
                 return cleaned
             except:
                 return "[SANITIZED: String could not be cleaned]"
+        elif data is None or isinstance(data, (bool, int, float)):
+            # JSON scalars pass through as-is - no need to serialize them to check
+            return data
         else:
-            try:
-                json.dumps(data)  # Test if it's JSON serializable
-                return data
-            except:
-                return str(data) if data is not None else None
+            return str(data)
     
-    def create_analysis_prompt(self, original_text: str, human_analysis: str, 
-                              source_language: str = "unknown") -> str:
-        """Create the prompt for LLM analysis."""
+    def create_system_prompt(self) -> str:
+        """Create the static instructions shared by every analysis request.
         
-        prompt = f"""You are an expert analyst of Russian propaganda and disinformation techniques. Analyze the provided text and human analysis to identify specific propaganda patterns.
-
-ORIGINAL SOURCE TEXT ({source_language}):
-```
-{original_text}
-```
-
-HUMAN ANALYSIS:
-```
-{human_analysis}
-```
+        Keeping these identical across calls (and separate from the article) lets
+        LM Studio reuse the cached prefix instead of re-processing it per article.
+        """
+        
+        return """You are an expert analyst of Russian propaganda and disinformation techniques. You will be given an original source text and, optionally, a human analysis of it. Analyze them to identify specific propaganda patterns.
 
 Please identify and extract:
 
@@ -238,61 +646,93 @@ CRITICAL: For the "translation" field:
 - If source IS English: Use null
 - NEVER use placeholder text like "English translation of original text"
 
-Respond in this exact JSON format:
-```json
-{{
+Respond with only this exact JSON format, wrapped in <json></json> tags:
+<json>
+{
   "translation": "[COMPLETE ENGLISH TRANSLATION HERE OR null IF ALREADY ENGLISH]",
   "primary_narrative": "NARRATIVE_NAME",
   "techniques": ["TECHNIQUE1", "TECHNIQUE2"],
   "key_phrases": ["phrase1", "phrase2", "phrase3"],
   "emotional_appeals": ["emotion1", "emotion2"],
   "target_audience": "description of intended audience",
-  "scores": {{
+  "scores": {
     "russian_alignment": 0,
     "sophistication": 0, 
     "effectiveness": 0
-  }},
+  },
   "analysis_notes": "Brief explanation of why these patterns were identified"
-}}
+}
+</json>
+
+Always respond with valid JSON in the exact format requested."""
+    
+    def create_analysis_prompt(self, original_text: str, human_analysis: str, 
+                              source_language: str = "unknown") -> str:
+        """Create the per-article part of the prompt for LLM analysis."""
+        
+        prompt = f"""ORIGINAL SOURCE TEXT ({source_language}):
+```
+{original_text}
+```
+
+HUMAN ANALYSIS:
+```
+{human_analysis}
 ```"""
         
         return prompt
     
-    def query_llm(self, prompt: str) -> Optional[Dict]:
-        """Send prompt to LM Studio and get structured response."""
+    def max_tokens_for(self, original_text: str, source_language: str = "unknown") -> int:
+        """Size the completion budget to the article instead of using one fixed limit."""
+        budget = 1024  # Room for the JSON analysis fields
+        if source_language.strip().lower() not in _ENGLISH_LANGUAGES:
+            # The translation is roughly as long as the source (~3 chars per token)
+            budget += len(original_text) // 3
+        return min(4096, budget)
+    
+    def query_llm(self, prompt: str, max_tokens: int = 2500) -> Optional[Dict]:
+        """Send prompt to LM Studio and get structured response, using the cache when possible."""
+        payload = {
+            "model": self.model_name,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": self._system_prompt
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "temperature": self.temperature,  # Low temperature for consistency
+            "max_tokens": max_tokens,
+            "stop": ["</json>"],  # End generation as soon as the JSON object is closed
+            "stream": self.stream,
+            "cache_prompt": True  # Let llama.cpp reuse the KV cache for the shared system prompt
+        }
+        
+        cache_key = None
+        if self.cache is not None and self.temperature == 0:
+            cache_key = LLMCache.make_key(self.model_name, payload["messages"], self.temperature)
+            cached_result = self.cache.get(cache_key)
+            if cached_result is not None:
+                log.info("✓ Cache hit - reusing previous LLM analysis")
+                return cached_result
+        
+        result = self._request_analysis(payload)
+        
+        if result is not None and cache_key is not None:
+            self.cache.set(cache_key, result)
+        
+        return result
+    
+    def _request_analysis(self, payload: Dict) -> Optional[Dict]:
+        """POST a chat payload to LM Studio and parse the JSON analysis it returns."""
         try:
-            payload = {
-                "model": self.model_name,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert analyst of propaganda and disinformation. Always respond with valid JSON in the exact format requested."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.1,  # Low temperature for consistency
-                "max_tokens": 2500,  # Increased for detailed analysis
-                "stream": False
-            }
-            
-            response = requests.post(
-                self.lm_studio_url, 
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                timeout=60
-            )
-            
-            response.raise_for_status()
-            
-            # Extract content from response
-            response_data = response.json()
-            content = response_data["choices"][0]["message"]["content"]
+            content = self._fetch_completion(payload)
             
             # Extract JSON from response (handle multiple formats)
-            print(f"DEBUG: Raw LLM response length: {len(content)} chars")
+            log.debug(f"Raw LLM response length: {len(content)} chars")
             
             # Try multiple JSON extraction patterns
             json_str = None
@@ -301,51 +741,63 @@ Respond in this exact JSON format:
             json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
             if json_match:
                 json_str = json_match.group(1)
-                print("DEBUG: Found JSON in code block")
+                log.debug("Found JSON in code block")
             else:
                 # Pattern 2: Look for JSON object boundaries
                 brace_match = re.search(r'\{.*\}', content, re.DOTALL)
                 if brace_match:
                     json_str = brace_match.group(0)
-                    print("DEBUG: Found JSON object")
+                    log.debug("Found JSON object")
                 else:
                     # Pattern 3: Use entire content
                     json_str = content
-                    print("DEBUG: Using entire response as JSON")
+                    log.debug("Using entire response as JSON")
             
-            print(f"DEBUG: Extracted JSON length: {len(json_str)} chars")
+            log.debug(f"Extracted JSON length: {len(json_str)} chars")
+            
+            # Fast path: parse and validate against the schema in a single pass
+            try:
+                analysis = LLMAnalysis.model_validate_json(json_str)
+                log.debug("JSON parsed and validated successfully")
+                return self._clean_json_data(analysis.model_dump())
+            except ValidationError as e:
+                # Malformed JSON goes through the diagnostics and repair path below
+                if not any(error["type"] == "json_invalid" for error in e.errors()):
+                    raise
             
             # Parse JSON response with enhanced error handling
             try:
                 parsed_json = json.loads(json_str)
-                print("DEBUG: JSON parsed successfully")
+                log.debug("JSON parsed successfully")
                 # Validate and clean the parsed JSON
                 return self._validate_and_clean_llm_response(parsed_json)
             except json.JSONDecodeError as e:
-                print(f"JSON parsing error: {e}")
+                log.error(f"JSON parsing error: {e}")
                 error_pos = e.pos if hasattr(e, 'pos') else 0
-                print(f"Error at position: {error_pos}")
+                log.debug(f"Error at position: {error_pos}")
                 
                 # Show context around the error position
                 if error_pos < len(json_str):
                     context_start = max(0, error_pos - 50)
                     context_end = min(len(json_str), error_pos + 50)
-                    print(f"Context around error:")
-                    print(f"'{json_str[context_start:error_pos]}[ERROR HERE]{json_str[error_pos:context_end]}'")
-                    print(f"Problematic character: '{json_str[error_pos]}' (ASCII: {ord(json_str[error_pos])})")
+                    log.debug("Context around error:")
+                    log.debug(f"'{json_str[context_start:error_pos]}[ERROR HERE]{json_str[error_pos:context_end]}'")
+                    log.debug(f"Problematic character: '{json_str[error_pos]}' (ASCII: {ord(json_str[error_pos])})")
                 
-                print(f"First 200 chars: {json_str[:200]}")
-                print(f"Last 200 chars: {json_str[-200:]}")
+                log.debug(f"First 200 chars: {json_str[:200]}")
+                log.debug(f"Last 200 chars: {json_str[-200:]}")
                 
                 # Try to fix common JSON issues
+                fixed_json = json_str
                 try:
-                    print("DEBUG: Attempting JSON repair...")
-                    fixed_json = self._fix_json_string(json_str)
-                    parsed_json = json.loads(fixed_json)
-                    print("DEBUG: JSON repair successful")
+                    log.debug("Attempting JSON repair...")
+                    fixed_json, parsed_json = self._fix_json_string(json_str)
+                    if parsed_json is None:
+                        parsed_json = json.loads(fixed_json)
+                    log.debug("JSON repair successful")
                     return self._validate_and_clean_llm_response(parsed_json)
                 except Exception as repair_error:
-                    print(f"JSON repair failed: {repair_error}")
+                    log.error(f"JSON repair failed: {repair_error}")
                     
                     # If repair fails, let's try a different approach
                     # Show the problematic line
@@ -354,26 +806,65 @@ Respond in this exact JSON format:
                         if error_pos < len(fixed_json):
                             lines = fixed_json[:error_pos].split('\n')
                             error_line = len(lines)
-                            print(f"Error appears to be on line {error_line}")
+                            log.debug(f"Error appears to be on line {error_line}")
                             if error_line <= len(fixed_json.split('\n')):
                                 problem_line = fixed_json.split('\n')[error_line-1] if error_line > 0 else ""
-                                print(f"Problematic line: '{problem_line}'")
+                                log.debug(f"Problematic line: '{problem_line}'")
                     
-                    print(f"Raw response (first 500 chars): {content[:500]}...")
+                    log.debug(f"Raw response (first 500 chars): {content[:500]}...")
                     return None
                 
         except requests.RequestException as e:
-            print(f"Error communicating with LM Studio: {e}")
+            log.error(f"Error communicating with LM Studio: {e}")
             return None
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            log.error(f"Unexpected error: {e}")
             return None
     
-    def _fix_json_string(self, json_str: str) -> str:
-        """Attempt to fix common JSON formatting issues."""
+    def _fetch_completion(self, payload: Dict) -> str:
+        """POST a chat payload and return the assistant message text.
+        
+        With streaming enabled the OpenAI-style SSE deltas are consumed as they
+        arrive, so the raw response body is never buffered in full.
+        """
+        with self.session.post(
+            self.lm_studio_url,
+            headers={"Content-Type": "application/json"},
+            data=_json_dumps(payload),
+            stream=payload.get("stream", False),
+            timeout=60  # With streaming this bounds the gap between chunks
+        ) as response:
+            response.raise_for_status()
+            
+            if not payload.get("stream"):
+                response_data = _json_loads(response.content)
+                return response_data["choices"][0]["message"]["content"]
+            
+            parts = []
+            for line in response.iter_lines():
+                # SSE frames look like "data: {...}"; skip keep-alives and comments
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                chunk = _json_loads(data)
+                choices = chunk.get("choices") or [{}]
+                delta = choices[0].get("delta") or {}
+                if delta.get("content"):
+                    parts.append(delta["content"])
+            
+            return "".join(parts)
+    
+    def _fix_json_string(self, json_str: str) -> Tuple[str, Optional[Dict]]:
+        """Attempt to fix common JSON formatting issues.
+        
+        Returns the repaired string and, when the repair already parsed it
+        successfully, the parsed object so callers don't decode it twice.
+        """
         import re
         
-        print("DEBUG: Starting JSON repair...")
+        log.debug("Starting JSON repair...")
         original_length = len(json_str)
         
         # Clean up basic formatting
@@ -382,18 +873,18 @@ Respond in this exact JSON format:
         # Remove extra quotes around the entire JSON
         if json_str.startswith('\"') and json_str.endswith('\"'):
             json_str = json_str[1:-1]
-            print("DEBUG: Removed outer quotes")
+            log.debug("Removed outer quotes")
         
         # CRITICAL FIXES for LLM JSON issues
-        print("DEBUG: Applying critical JSON fixes...")
+        log.debug("Applying critical JSON fixes...")
         
         # Fix 1: Handle double quotes in arrays ""text"" -> "\"text\""
         # This is the main issue causing parse failures
-        print("DEBUG: Fixing double-quoted array items...")
+        log.debug("Fixing double-quoted array items...")
         json_str = re.sub(r'""([^"]+)""', r'"\"\1\""', json_str)
         
         # Fix 2: Handle unescaped literal \n -> \\n in string values
-        print("DEBUG: Fixing unescaped newlines in string values...")
+        log.debug("Fixing unescaped newlines in string values...")
         def fix_escapes_in_strings(match):
             prefix = match.group(1)  # "field": "
             content = match.group(2)  # content
@@ -409,21 +900,21 @@ Respond in this exact JSON format:
         # Apply to all string field values
         json_str = re.sub(r'("[^"]+"\s*:\s*")(.*?)("(?:\s*[,}]))', fix_escapes_in_strings, json_str, flags=re.DOTALL)
         
-        print(f"DEBUG: Critical fixes applied. Length: {original_length} -> {len(json_str)}")
+        log.debug(f"Critical fixes applied. Length: {original_length} -> {len(json_str)}")
         
         # Try parsing now to see if we fixed the main issues
         try:
-            test_parse = json.loads(json_str)
-            print("DEBUG: ✓ JSON parses successfully after critical fixes!")
-            return json_str
+            parsed_json = json.loads(json_str)
+            log.debug("✓ JSON parses successfully after critical fixes!")
+            return json_str, parsed_json
         except json.JSONDecodeError as e:
-            print(f"DEBUG: Still has issues after critical fixes: {e}")
+            log.debug(f"Still has issues after critical fixes: {e}")
             # Continue with the more complex repair logic below...
         
         # The main issue: LLM returns \n in strings that should be \\n for valid JSON
         # We need to escape actual newlines and literal \n sequences in string values
         
-        print("DEBUG: Fixing unescaped newlines in string values...")
+        log.debug("Fixing unescaped newlines in string values...")
         
         # Method: Find all string values and properly escape them
         # Use a more targeted regex approach
@@ -433,7 +924,7 @@ Respond in this exact JSON format:
             key = match.group(1)
             content = match.group(2)
             
-            print(f"DEBUG: Fixing string field '{key}' (length: {len(content)})")
+            log.debug(f"Fixing string field '{key}' (length: {len(content)})")
             
             # The content might have:
             # 1. Literal \n that should become \\n 
@@ -463,7 +954,7 @@ Respond in this exact JSON format:
         # For safety, let's also try a simpler approach first
         # Just escape the obvious \n sequences in the translation field specifically
         if '"translation":' in json_str:
-            print("DEBUG: Found translation field, applying targeted fix...")
+            log.debug("Found translation field, applying targeted fix...")
             
             # Find the translation field and fix it specifically
             translation_pattern = r'("translation":\s*")(.*?)("(?=\s*[,}]))'
@@ -473,7 +964,7 @@ Respond in this exact JSON format:
                 content = match.group(2) 
                 suffix = match.group(3)
                 
-                print(f"DEBUG: Fixing translation field content (length: {len(content)})")
+                log.debug(f"Fixing translation field content (length: {len(content)})")
                 
                 # Fix the literal \n sequences that are causing JSON parsing to fail
                 fixed_content = content.replace('\\n', '\\\\n')
@@ -488,92 +979,126 @@ Respond in this exact JSON format:
                 # Fix quotes
                 fixed_content = re.sub(r'(?<!\\)"', '\\\\"', fixed_content)
                 
-                print(f"DEBUG: Translation field fixed. New length: {len(fixed_content)}")
+                log.debug(f"Translation field fixed. New length: {len(fixed_content)}")
                 return prefix + fixed_content + suffix
             
             json_str = re.sub(translation_pattern, fix_translation_field, json_str, flags=re.DOTALL)
         
         # Apply the general fix to all other string fields
-        print("DEBUG: Applying general string field fixes...")
+        log.debug("Applying general string field fixes...")
         json_str = re.sub(pattern, fix_string_value, json_str, flags=re.DOTALL)
         
-        print(f"DEBUG: JSON repair complete. Length: {original_length} -> {len(json_str)}")
+        log.debug(f"JSON repair complete. Length: {original_length} -> {len(json_str)}")
         
         # Show a preview of the fixed content
         if len(json_str) > 400:
-            print(f"DEBUG: Fixed JSON preview:")
-            print(f"  Start: {json_str[:200]}")
-            print(f"  End: {json_str[-200:]}")
+            log.debug("Fixed JSON preview:")
+            log.debug(f"  Start: {json_str[:200]}")
+            log.debug(f"  End: {json_str[-200:]}")
         else:
-            print(f"DEBUG: Fixed JSON: {json_str}")
+            log.debug(f"Fixed JSON: {json_str}")
         
-        return json_str
+        return json_str, None
     
     def _validate_and_clean_llm_response(self, response: Dict) -> Dict:
         """Validate and clean LLM response to ensure it's safe for JSON storage."""
-        cleaned_response = {}
-        
-        # Required fields with defaults
-        required_fields = {
-            "translation": None,
-            "primary_narrative": "UNKNOWN",
-            "techniques": [],
-            "key_phrases": [],
-            "emotional_appeals": [],
-            "target_audience": "Unknown",
-            "scores": {"russian_alignment": 0, "sophistication": 0, "effectiveness": 0},
-            "analysis_notes": ""
-        }
+        analysis = LLMAnalysis.model_validate(response)
+        return self._clean_json_data(analysis.model_dump())
+    
+    def process_article(self, 
+                       original_text: str,
+                       human_analysis: str,
+                       title: str = "",
+                       source_url: str = "",
+                       source_language: str = "unknown") -> bool:
+        """Process a single article through LLM analysis - CREATES EXACTLY ONE ENTRY."""
         
-        for field, default in required_fields.items():
-            if field in response:
-                cleaned_value = self._clean_json_data(response[field])
-                cleaned_response[field] = cleaned_value
-            else:
-                cleaned_response[field] = default
+        future = self.submit_article(original_text, human_analysis, title, source_url, source_language)
+        if future is None:
+            return False
+        
+        # Get LLM analysis
+        llm_result = future.result()
         
-        # Ensure scores is properly structured
-        if not isinstance(cleaned_response["scores"], dict):
-            cleaned_response["scores"] = {"russian_alignment": 0, "sophistication": 0, "effectiveness": 0}
+        if not llm_result:
+            log.error("✗ Failed to get valid LLM response")
+            return False
         
-        # Ensure lists are actually lists
-        for list_field in ["techniques", "key_phrases", "emotional_appeals"]:
-            if not isinstance(cleaned_response[list_field], list):
-                cleaned_response[list_field] = []
+        self._add_entry(original_text, human_analysis, title, source_url, source_language, llm_result)
         
-        return cleaned_response
+        return True
     
-    def process_article(self, 
+    def submit_article(self,
                        original_text: str,
                        human_analysis: str,
                        title: str = "",
                        source_url: str = "",
-                       source_language: str = "unknown") -> bool:
-        """Process a single article through LLM analysis - CREATES EXACTLY ONE ENTRY."""
+                       source_language: str = "unknown") -> Optional[Future]:
+        """Start LLM analysis of an article in the background.
+        
+        Returns a Future resolving to the parsed LLM result (or None on failure),
+        or None if the user cancelled at the duplicate warning.
+        """
         
-        print(f"🔍 Processing: {title[:50] if title else 'Untitled'}...")
+        log.info(f"🔍 Processing: {title[:50] if title else 'Untitled'}...")
         
         # Safety check - warn if this looks like a duplicate
         if self._looks_like_duplicate(original_text, title, source_url):
-            print("⚠️  WARNING: This article appears similar to an existing entry!")
-            proceed = input("Continue anyway? (y/N): ").strip().lower()
-            if proceed != 'y':
-                print("❌ Processing cancelled")
-                return False
+            log.warning("⚠️  WARNING: This article appears similar to an existing entry!")
+            if input("Continue anyway? (y/N): ").strip().lower() not in _YES_ANSWERS:
+                log.info("❌ Processing cancelled")
+                return None
         
         # Create analysis prompt
         prompt = self.create_analysis_prompt(original_text, human_analysis, source_language)
         
-        # Get LLM analysis
-        llm_result = self.query_llm(prompt)
+        return self._llm_pool.submit(
+            self.query_llm, prompt, self.max_tokens_for(original_text, source_language)
+        )
+    
+    def _collect_finished(self, pending: List, wait: bool = False) -> int:
+        """Turn finished background analyses into entries; with wait=True, finish all of them.
         
-        if not llm_result:
-            print("✗ Failed to get valid LLM response")
-            return False
+        Returns the number of entries added.
+        """
+        still_pending = []
+        added = 0
+        
+        for article, future in pending:
+            if not wait and not future.done():
+                still_pending.append((article, future))
+                continue
+            
+            llm_result = future.result()
+            title = article["title"] or "Untitled"
+            
+            if llm_result:
+                log.info(f"\n💾 Saving '{title[:50]}' to database...")
+                entry = self._add_entry(llm_result=llm_result, **article)
+                self._record_entry(entry)
+                added += 1
+                log.info(f"✅ PROCESSING COMPLETE! Total entries now: {len(self.data['entries'])}")
+            else:
+                log.error(f"\n❌ PROCESSING FAILED for '{title[:50]}' - article was not saved.")
+        
+        pending[:] = still_pending
+        return added
+    
+    def _add_entry(self,
+                   original_text: str,
+                   human_analysis: str,
+                   title: str,
+                   source_url: str,
+                   source_language: str,
+                   llm_result: Optional[Dict]) -> Dict:
+        """Append one entry built from an LLM result to the in-memory data.
+        
+        llm_result is None for articles the pre-filter excluded from LLM analysis.
+        """
         
         # DEBUG: Check current entry count before adding
         entries_before = len(self.data["entries"])
-        print(f"📊 Entries before processing: {entries_before}")
+        log.info(f"📊 Entries before processing: {entries_before}")
         
         # Create entry for data file - THIS SHOULD CREATE ONLY ONE ENTRY
         entry = {
@@ -584,26 +1109,73 @@ Respond in this exact JSON format:
             "source_language": source_language,
             "original_text": original_text,
             "human_analysis": human_analysis,
+            "content_hash": self._content_hash(original_text),
             "llm_analysis": llm_result  # ALL analysis including translation goes here
         }
         
         # Add to data - THIS IS THE ONLY PLACE AN ENTRY SHOULD BE ADDED
         self.data["entries"].append(entry)
+        self._index_entry(entry)
         entries_after = len(self.data["entries"])
         
-        print(f"✓ Created entry #{entry['id']}")
-        print(f"📊 Entries after processing: {entries_after}")
-        print(f"✓ Primary narrative: {llm_result.get('primary_narrative', 'None')}")
-        print(f"✓ Techniques: {', '.join(llm_result.get('techniques', []))}")
-        print(f"✓ Russian Alignment: {llm_result.get('scores', {}).get('russian_alignment', 0)}/5")
+        log.info(f"✓ Created entry #{entry['id']}")
+        log.info(f"📊 Entries after processing: {entries_after}")
+        
+        if llm_result is None:
+            log.info("ℹ️  No propaganda markers found - recorded without LLM analysis")
+            return entry
+        
+        log.info(f"✓ Primary narrative: {llm_result.get('primary_narrative', 'None')}")
+        log.info(f"✓ Techniques: {', '.join(llm_result.get('techniques', []))}")
+        log.info(f"✓ Russian Alignment: {llm_result.get('scores', {}).get('russian_alignment', 0)}/5")
         
         # Verify translation is included
         if llm_result.get('translation'):
-            print("✓ Translation included in analysis")
+            log.info("✓ Translation included in analysis")
         else:
-            print("⚠️  No translation found in LLM response")
+            log.info("⚠️  No translation found in LLM response")
         
-        return True
+        return entry
+    
+    @staticmethod
+    def _content_hash(original_text: str) -> str:
+        """Hash article text for exact-duplicate detection (blake2b is fast in CPython).
+        
+        Line breaks are normalised first, so text pasted interactively (including
+        entries saved with literal "\\n" separators) matches the same text from JSONL.
+        """
+        text = original_text.replace('\r\n', '\n').replace('\\n', '\n').strip()
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _index_entry(self, entry: Dict):
+        """Add an entry to the exact-duplicate indexes."""
+        # Recomputed rather than read from the entry, which may predate normalisation
+        content_hash = self._content_hash(entry.get("original_text") or "")
+        if entry.get("llm_analysis") is None:
+            self._prefiltered_hashes.add(content_hash)
+        else:
+            self._seen[content_hash] = entry
+    
+    def _already_prefiltered(self, original_text: str) -> bool:
+        """True if this exact text was already recorded without LLM analysis."""
+        return self._content_hash(original_text) in self._prefiltered_hashes
+    
+    def _seen_entry(self, original_text: str) -> Optional[Dict]:
+        """Return the existing entry with exactly this text, if any."""
+        return self._seen.get(self._content_hash(original_text))
+    
+    def _needs_llm(self, original_text: str, human_analysis: str, source_language: str = "unknown") -> bool:
+        """Cheap pre-filter: False for articles with no analysis and no propaganda markers.
+        
+        Only languages with a marker list are filtered; anything else goes to the LLM.
+        """
+        if not self.prefilter or human_analysis.strip():
+            return True
+        language = source_language.strip().lower()
+        markers = PROPAGANDA_MARKER_RES.get(_MARKER_LANGUAGE_ALIASES.get(language, language))
+        if markers is None:
+            return True
+        return markers.search(original_text) is not None
     
     def _looks_like_duplicate(self, original_text: str, title: str, source_url: str) -> bool:
         """Check if article might be a duplicate (for warning purposes only)."""
@@ -658,7 +1230,7 @@ Respond in this exact JSON format:
             result = input(prompt).strip()
             return result
         except (EOFError, KeyboardInterrupt):
-            print("\\nExiting...")
+            log.info("\nExiting...")
             return "quit"
     
     def _clean_web_content(self, content: str) -> str:
@@ -690,12 +1262,12 @@ Respond in this exact JSON format:
             content = content.replace(entity, replacement)
         
         # Clean up excessive whitespace
-        content = re.sub(r'\\n\\s*\\n\\s*\\n+', '\\n\\n', content)  # Max 2 newlines
+        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)  # Max 2 newlines
         content = re.sub(r' +', ' ', content)  # Multiple spaces to single
-        content = re.sub(r'\\t+', ' ', content)  # Tabs to spaces
+        content = re.sub(r'\t+', ' ', content)  # Tabs to spaces
         
         # Clean up lines
-        lines = content.split('\\n')
+        lines = content.split('\n')
         cleaned_lines = []
         
         for line in lines:
@@ -703,16 +1275,21 @@ Respond in this exact JSON format:
             if line and not line.isspace():
                 cleaned_lines.append(line)
         
-        return '\\n'.join(cleaned_lines).strip()
+        return '\n'.join(cleaned_lines).strip()
     
     def process_batch(self, articles: List[Dict]) -> int:
-        """Process multiple articles in batch."""
+        """Process articles one at a time, in order.
+        
+        Unlike batch_process, this waits for each LLM call before starting the
+        next and goes through process_article, so it may prompt on likely
+        duplicates. Use batch_process for unattended, concurrent runs.
+        """
         successful = 0
         
-        print(f"Processing {len(articles)} articles...")
+        log.info(f"Processing {len(articles)} articles...")
         
         for i, article in enumerate(articles, 1):
-            print(f"\\n[{i}/{len(articles)}] ", end="")
+            log.info(f"\n[{i}/{len(articles)}]")
             
             if self.process_article(
                 original_text=article.get("original_text", ""),
@@ -726,23 +1303,184 @@ Respond in this exact JSON format:
         # Save all updates
         self.save_data()
         
-        print(f"\\n✓ Successfully processed {successful}/{len(articles)} articles")
+        log.info(f"\n✓ Successfully processed {successful}/{len(articles)} articles")
+        return successful
+    
+    def batch_process(self, articles: List[Dict], batch_size: Optional[int] = None) -> int:
+        """Process articles non-interactively, keeping batch_size LLM requests in flight.
+        
+        LM Studio/vLLM batch concurrent requests on the server side, so submitting
+        several prompts at once yields far more throughput than one-at-a-time.
+        Entries are added in input order and the data file is saved once at the end.
+        Unlike process_batch, it never prompts; likely duplicates are not skipped.
+        batch_size defaults to the one the extractor was created with.
+        """
+        batch_size = batch_size or self.batch_size
+        if batch_size > self._pool_size:
+            # Connections beyond the pool size would be discarded after every request
+            self.session.close()
+            self.session = self._create_session(batch_size)
+        successful = 0
+        total = len(articles)
+        submitted_hashes = set()  # Catches repeats within this input
+        
+        log.info(f"Processing {total} articles ({batch_size} concurrent requests)...")
+        
+        for start in range(0, total, batch_size):
+            chunk = articles[start:start + batch_size]
+            results = {}
+            prefiltered = set()
+            
+            with ThreadPoolExecutor(max_workers=batch_size) as pool:
+                futures = {}
+                for offset, article in enumerate(chunk):
+                    index = start + offset
+                    original_text = article.get("original_text", "")
+                    title = article.get("title", f"Article {index + 1}")
+                    
+                    seen = self._seen_entry(original_text)
+                    if seen is not None:
+                        log.info(f"⏭️  [{index + 1}/{total}] Same text as entry #{seen.get('id')} - skipping: {title[:50]}")
+                        continue
+                    
+                    content_hash = self._content_hash(original_text)
+                    if content_hash in submitted_hashes:
+                        log.info(f"⏭️  [{index + 1}/{total}] Same text appears earlier in this batch - skipping: {title[:50]}")
+                        continue
+                    submitted_hashes.add(content_hash)
+                    
+                    if not self._needs_llm(original_text, article.get("human_analysis", ""), article.get("source_language", "unknown")):
+                        log.info(f"ℹ️  [{index + 1}/{total}] No propaganda markers - skipping LLM: {title[:50]}")
+                        if not self._already_prefiltered(original_text):
+                            prefiltered.add(index)
+                            results[index] = None
+                        continue
+                    
+                    source_language = article.get("source_language", "unknown")
+                    prompt = self.create_analysis_prompt(
+                        original_text,
+                        article.get("human_analysis", ""),
+                        source_language
+                    )
+                    max_tokens = self.max_tokens_for(original_text, source_language)
+                    futures[pool.submit(self.query_llm, prompt, max_tokens)] = index
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    results[index] = future.result()
+                    status = "✓" if results[index] else "✗"
+                    log.info(f"{status} [{index + 1}/{total}] LLM response received")
+            
+            # Add entries in input order so ids follow the source file
+            for index in sorted(results):
+                llm_result = results[index]
+                if not llm_result and index not in prefiltered:
+                    continue
+                
+                article = articles[index]
+                self._add_entry(
+                    original_text=article.get("original_text", ""),
+                    human_analysis=article.get("human_analysis", ""),
+                    title=article.get("title", f"Article {index + 1}"),
+                    source_url=article.get("source_url", ""),
+                    source_language=article.get("source_language", "unknown"),
+                    llm_result=llm_result
+                )
+                if index not in prefiltered:
+                    successful += 1
+        
+        # Save all updates
+        self.save_data()
+        
+        log.info(f"\n✓ Successfully processed {successful}/{total} articles")
+        return successful
+    
+    def queue_mode(self, articles_iter: Iterable[Dict]) -> int:
+        """Process a stream of articles without prompts.
+        
+        Up to max_inflight requests are kept in flight so LM Studio always has
+        work queued, and articles are only read from articles_iter as slots free
+        up. Entries are journaled as they complete.
+        """
+        slots = threading.BoundedSemaphore(self.max_inflight)
+        submitted_hashes = set()  # Catches repeats within this input
+        pending = []
+        successful = 0
+        count = 0
+        
+        for count, raw_article in enumerate(articles_iter, 1):
+            article = {
+                "original_text": raw_article.get("original_text", ""),
+                "human_analysis": raw_article.get("human_analysis", ""),
+                "title": raw_article.get("title", f"Article {count}"),
+                "source_url": raw_article.get("source_url", ""),
+                "source_language": raw_article.get("source_language", "unknown")
+            }
+            
+            seen = self._seen_entry(article["original_text"])
+            if seen is not None:
+                log.info(f"⏭️  [{count}] Same text as entry #{seen.get('id')} - skipping: {article['title'][:50]}")
+                continue
+            
+            content_hash = self._content_hash(article["original_text"])
+            if content_hash in submitted_hashes:
+                log.info(f"⏭️  [{count}] Same text appears earlier in this input - skipping: {article['title'][:50]}")
+                continue
+            submitted_hashes.add(content_hash)
+            
+            if not self._needs_llm(article["original_text"], article["human_analysis"], article["source_language"]):
+                log.info(f"ℹ️  [{count}] No propaganda markers - skipping LLM: {article['title'][:50]}")
+                if not self._already_prefiltered(article["original_text"]):
+                    self._record_entry(self._add_entry(llm_result=None, **article))
+                continue
+            
+            prompt = self.create_analysis_prompt(
+                article["original_text"], article["human_analysis"], article["source_language"]
+            )
+            
+            max_tokens = self.max_tokens_for(article["original_text"], article["source_language"])
+            
+            slots.acquire()
+            future = self._llm_pool.submit(self.query_llm, prompt, max_tokens)
+            future.add_done_callback(lambda _: slots.release())
+            pending.append((article, future))
+            
+            successful += self._collect_finished(pending)
+        
+        successful += self._collect_finished(pending, wait=True)
+        self.save_data()
+        
+        log.info(f"\n✓ Successfully processed {successful}/{count} articles")
         return successful
     
     def interactive_mode(self):
         """Interactive mode for single article processing."""
-        print("\\n" + "="*70)
-        print("🔍 LLM-POWERED PROPAGANDA PATTERN EXTRACTOR")
-        print("="*70)
-        print("📝 This tool processes ONE article at a time and creates ONE database entry")
-        print("🌐 Non-English articles will be translated automatically")
-        print("="*70)
+        log.info(f"""
+{_RULE_WIDE}
+🔍 LLM-POWERED PROPAGANDA PATTERN EXTRACTOR
+{_RULE_WIDE}
+📝 Each article creates ONE database entry
+⏳ LLM analysis runs in the background - enter the next article while it works
+🌐 Non-English articles will be translated automatically
+{_RULE_WIDE}""")
         
+        pending = []
+        try:
+            self._interactive_loop(pending)
+        finally:
+            # EOF or Ctrl+C at a prompt must not drop analyses that are done or in flight
+            if pending:
+                log.info(f"\n⏳ Saving {len(pending)} article(s) still being analyzed...")
+                self._collect_finished(pending, wait=True)
+    
+    def _interactive_loop(self, pending: List):
+        """Read articles until the user quits, queueing each for background analysis."""
         while True:
-            print(f"\\n📊 Current database: {len(self.data['entries'])} entries")
-            print("\\n" + "─"*50)
-            print("📰 NEW ARTICLE INPUT")
-            print("─"*50)
+            self._collect_finished(pending)
+            log.info(f"\n📊 Current database: {len(self.data['entries'])} entries")
+            if pending:
+                log.info(f"⏳ Articles still being analyzed: {len(pending)}")
+            log.info(f"\n{_THIN_RULE}\n📰 NEW ARTICLE INPUT\n{_THIN_RULE}")
             
             # Clear any residual input buffer
             import sys
@@ -757,30 +1495,36 @@ Respond in this exact JSON format:
                     termios.tcflush(sys.stdin, termios.TCIOFLUSH)
             
             title = self._safe_input("📰 Article Title (or 'quit' to exit): ")
-            if title.lower() in ['quit', 'exit', 'q']:
-                print("\\n👋 Goodbye!")
+            if title.lower() in _QUIT_COMMANDS:
+                if pending:
+                    log.info(f"\n⏳ Waiting for {len(pending)} article(s) still being analyzed...")
+                    self._collect_finished(pending, wait=True)
+                log.info("\n👋 Goodbye!")
                 break
             
             # Debug: Show what was actually entered
-            print(f"DEBUG: Title received: '{title[:100]}...' (length: {len(title)})")
+            log.debug(f"Title received: '{title[:100]}...' (length: {len(title)})")
                 
             source_url = self._safe_input("🔗 Source URL: ")
-            print(f"DEBUG: URL received: '{source_url[:100]}...' (length: {len(source_url)})")
+            log.debug(f"URL received: '{source_url[:100]}...' (length: {len(source_url)})")
             
             source_language = self._safe_input("🌐 Source Language (e.g., polish, russian, english): ") or "unknown"
-            print(f"DEBUG: Language received: '{source_language[:100]}...' (length: {len(source_language)})")
+            log.debug(f"Language received: '{source_language[:100]}...' (length: {len(source_language)})")
             
-            print("\\n" + "─"*50)
-            print("📄 PASTE ORIGINAL TEXT")
-            print("─"*50)
-            print("Paste the article content below.")
-            print("When finished, press ENTER twice (two empty lines):")
-            print()
+            log.info(f"""
+{_THIN_RULE}
+📄 PASTE ORIGINAL TEXT
+{_THIN_RULE}
+Paste the article content below.
+When finished, press ENTER twice (two empty lines):
+""")
             
             original_lines = []
             empty_count = 0
             while True:
                 line = input()
+                # Journal analyses that finished while the user was pasting
+                self._collect_finished(pending)
                 if line == "":
                     empty_count += 1
                     if empty_count >= 2:
@@ -789,126 +1533,157 @@ Respond in this exact JSON format:
                     empty_count = 0
                 original_lines.append(line)
             
-            original_text = "\\n".join(original_lines).strip()
+            original_text = "\n".join(original_lines).strip()
             
-            print("\\n" + "─"*50)
-            print("🧠 HUMAN ANALYSIS (Optional)")
-            print("─"*50)
-            print("Paste analysis from website (HTML tags OK).")
-            print("Press CTRL+D (Unix) or CTRL+Z+ENTER (Windows) when finished.")
-            print("Or type 'END' on a line by itself to finish:")
-            print()
+            seen = self._seen_entry(original_text)
+            if seen is not None:
+                log.info(f"\n⏭️  Identical text already stored as entry #{seen.get('id')} ({seen.get('title') or 'Untitled'}) - skipping")
+                continue
+            if any(article["original_text"] == original_text for article, _ in pending):
+                log.info("\n⏭️  Identical text is already being analyzed - skipping")
+                continue
+            
+            log.info(f"""
+{_THIN_RULE}
+🧠 HUMAN ANALYSIS (Optional)
+{_THIN_RULE}
+Paste analysis from website (HTML tags OK).
+Press CTRL+D (Unix) or CTRL+Z+ENTER (Windows) when finished.
+Or type 'END' on a line by itself to finish:
+
+Paste your content (type END on empty line to finish):""")
             
             analysis_lines = []
-            print("Paste your content (type END on empty line to finish):")
             
             while True:
                 try:
                     line = input()
                     
                     # Check for end markers
-                    if line.strip().upper() in ['END', 'DONE', 'FINISH']:
-                        print("DEBUG: End marker detected")
+                    if line.strip().lower() in _END_MARKERS:
+                        log.debug("End marker detected")
                         break
                         
                     analysis_lines.append(line)
                     
                     # Give feedback every 5 lines to show it's working
                     if len(analysis_lines) % 5 == 0:
-                        print(f"[{len(analysis_lines)} lines received...]", flush=True)
+                        log.info(f"[{len(analysis_lines)} lines received...]")
                         
                 except EOFError:
-                    print("\\nEOF detected - finishing input")
+                    log.info("\nEOF detected - finishing input")
                     break
                 except KeyboardInterrupt:
-                    print("\\nSkipping human analysis...")
+                    log.info("\nSkipping human analysis...")
                     analysis_lines = []
                     break
             
             # Clean up the HTML/web content
-            raw_analysis = "\\n".join(analysis_lines)
+            raw_analysis = "\n".join(analysis_lines)
             human_analysis = self._clean_web_content(raw_analysis)
             
-            print(f"DEBUG: Received {len(analysis_lines)} lines")
-            print(f"DEBUG: Raw length: {len(raw_analysis)} chars")
-            print(f"DEBUG: Cleaned length: {len(human_analysis)} chars")
-            print(f"DEBUG: Preview: '{human_analysis[:100]}...'")
+            log.debug(f"Received {len(analysis_lines)} lines")
+            log.debug(f"Raw length: {len(raw_analysis)} chars")
+            log.debug(f"Cleaned length: {len(human_analysis)} chars")
+            log.debug(f"Preview: '{human_analysis[:100]}...'")
             
             if human_analysis:
-                print(f"✓ Human analysis captured ({len(human_analysis)} chars)")
+                log.info(f"✓ Human analysis captured ({len(human_analysis)} chars)")
             else:
-                print("ℹ️  No human analysis provided")
+                log.info("ℹ️  No human analysis provided")
             
             # Show summary
-            print("\\n" + "═"*50)
-            print("📋 PROCESSING SUMMARY")
-            print("═"*50)
-            print(f"📰 Title: {title}")
-            print(f"🔗 URL: {source_url or 'None'}")
-            print(f"🌐 Language: {source_language}")
-            print(f"📄 Text length: {len(original_text):,} characters")
-            print(f"🧠 Human analysis: {'Yes' if human_analysis else 'None'}")
-            
-            print("\\n" + "="*50)
-            confirm = self._safe_input("🤖 Process with LLM? (Y/n): ").lower()
-            if confirm == 'n':
-                print("❌ Skipping article...")
+            log.info(f"""
+{_DOUBLE_RULE}
+📋 PROCESSING SUMMARY
+{_DOUBLE_RULE}
+📰 Title: {title}
+🔗 URL: {source_url or 'None'}
+🌐 Language: {source_language}
+📄 Text length: {len(original_text):,} characters
+🧠 Human analysis: {'Yes' if human_analysis else 'None'}""")
+            
+            if not self._needs_llm(original_text, human_analysis, source_language):
+                log.info("\nℹ️  No propaganda markers and no human analysis - skipping LLM")
+                if not self._already_prefiltered(original_text):
+                    entry = self._add_entry(original_text, human_analysis, title, source_url, source_language, None)
+                    self._record_entry(entry)
                 continue
             
-            print("\\n" + "🔄"*25)
-            print("🤖 PROCESSING WITH LLM...")
-            print("🔄"*25)
+            log.info(f"\n{_RULE}")
+            if self._safe_input("🤖 Process with LLM? (Y/n): ").lower() in _NO_ANSWERS:
+                log.info("❌ Skipping article...")
+                continue
             
             # THIS IS THE CRITICAL CALL - SHOULD CREATE EXACTLY ONE ENTRY
-            success = self.process_article(original_text, human_analysis, title, source_url, source_language)
-            
-            if success:
-                print("\\n💾 Saving to database...")
-                self.save_data()
-                print("\\n" + "✅"*25)
-                print("✅ PROCESSING COMPLETE!")
-                print("✅"*25)
-                print(f"📊 Total entries now: {len(self.data['entries'])}")
-            else:
-                print("\\n" + "❌"*25)
-                print("❌ PROCESSING FAILED!")
-                print("❌"*25)
-                print("Article was not saved.")
-            
-            print("\\n" + "="*50)
-            continue_choice = input("Process another article? (Y/n): ").strip().lower()
-            if continue_choice == 'n':
-                print("\\n👋 Session complete!")
+            future = self.submit_article(original_text, human_analysis, title, source_url, source_language)
+            
+            if future is not None:
+                pending.append(({
+                    "original_text": original_text,
+                    "human_analysis": human_analysis,
+                    "title": title,
+                    "source_url": source_url,
+                    "source_language": source_language
+                }, future))
+                log.info(f"\n🤖 Queued for LLM analysis ({len(pending)} in flight)")
+            
+            self._collect_finished(pending)
+            log.info(f"\n{_RULE}")
+            if input("Process another article? (Y/n): ").strip().lower() in _NO_ANSWERS:
+                if pending:
+                    log.info(f"\n⏳ Waiting for {len(pending)} article(s) still being analyzed...")
+                    self._collect_finished(pending, wait=True)
+                log.info("\n👋 Session complete!")
                 break
     
     def test_llm_connection(self) -> bool:
-        """Test connection to LM Studio."""
+        """Test connection to LM Studio via its model list (no generation needed).
+        
+        A successful check is remembered for the lifetime of the extractor.
+        """
+        if self._health_ok:
+            return True
+        
         try:
-            test_prompt = "Respond with exactly: {'status': 'ok'}"
+            models_url = self.lm_studio_url.replace('/chat/completions', '/models')
+            response = self.session.get(models_url, timeout=5)
+            response.raise_for_status()
             
-            payload = {
-                "model": self.model_name,
-                "messages": [{"role": "user", "content": test_prompt}],
-                "temperature": 0,
-                "max_tokens": 50
-            }
+            model_ids = [model.get("id") for model in _json_loads(response.content).get("data", [])]
+            if not model_ids:
+                log.error("✗ LM Studio is running but no model is loaded")
+                return False
             
-            response = requests.post(
-                self.lm_studio_url,
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                timeout=10
-            )
+            if self.model_name not in model_ids:
+                # LM Studio answers with the loaded model (or loads one on demand), so only warn
+                log.warning(f"⚠️  Model '{self.model_name}' not in LM Studio's list: {', '.join(model_ids)}")
             
-            response.raise_for_status()
-            print("✓ LM Studio connection successful")
+            log.info("✓ LM Studio connection successful")
+            self._health_ok = True
             return True
             
         except Exception as e:
-            print(f"✗ LM Studio connection failed: {e}")
-            print("Make sure LM Studio is running on http://localhost:1234")
+            log.error(f"✗ LM Studio connection failed: {e}")
+            log.error("Make sure LM Studio is running on http://localhost:1234")
             return False
 
+def iter_articles_jsonl(path: str) -> Iterator[Dict]:
+    """Lazily yield articles from a JSONL file (one JSON object per line)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _json_loads(line)
+            except json.JSONDecodeError as e:
+                log.warning(f"⚠️  Skipping invalid JSON on line {line_number} of {path}: {e}")
+
+def load_articles_jsonl(path: str) -> List[Dict]:
+    """Read all articles from a JSONL file (one JSON object per line)."""
+    return list(iter_articles_jsonl(path))
+
 def main():
     """Main function with command line interface."""
     import argparse
@@ -916,16 +1691,49 @@ def main():
     parser = argparse.ArgumentParser(description='LLM-Powered Propaganda Pattern Extractor')
     parser.add_argument('--test-connection', action='store_true', help='Test LM Studio connection')
     parser.add_argument('--interactive', action='store_true', help='Interactive article entry mode')
+    parser.add_argument('--batch', metavar='FILE', help='Process a JSONL file of articles without prompts')
+    parser.add_argument('--bulk', metavar='FILE',
+                        help='Stream a JSONL file of articles through the LLM without prompts')
+    parser.add_argument('--batch-size', type=int, default=16, help='Concurrent LLM requests in batch mode')
+    parser.add_argument('--max-inflight', type=int, default=4,
+                        help='Concurrent LLM requests in interactive and --bulk modes')
     parser.add_argument('--lm-url', default='http://localhost:1234/v1/chat/completions', help='LM Studio URL')
-    parser.add_argument('--model', default='local-model', help='Model name')
+    parser.add_argument('--model', default='local-model',
+                        help='Model name as loaded in LM Studio (a Q4_K_M/Q5_K_M GGUF quantization is recommended)')
     parser.add_argument('--data-file', default='propaganda_patterns_data.json', help='Output data file')
+    parser.add_argument('--temperature', type=float, default=0.1,
+                        help='Sampling temperature (responses are cached only at 0)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the LLM response cache')
+    parser.add_argument('--no-prefilter', action='store_true',
+                        help='Send every article to the LLM, even without propaganda markers '
+                             '(the filter only applies to English, Polish, Russian, Spanish, Czech, '
+                             'Hungarian and Serbian articles)')
+    parser.add_argument('--no-stream', action='store_true',
+                        help='Request complete (non-streamed) responses from LM Studio')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='More output: per-article progress in --batch/--bulk, -vv for debug details')
     
     args = parser.parse_args()
     
+    # Bulk runs only report problems by default so the hot path does no console I/O
+    base_level = logging.WARNING if (args.batch or args.bulk) else logging.INFO
+    log_level = max(logging.DEBUG, base_level - 10 * args.verbose)
+    logging.basicConfig(
+        level=log_level,
+        handlers=[logging.StreamHandler(sys.stdout)],
+        format="%(message)s"
+    )
+    
     extractor = LLMPropagandaExtractor(
         lm_studio_url=args.lm_url,
         model_name=args.model,
-        data_file=args.data_file
+        data_file=args.data_file,
+        temperature=args.temperature,
+        use_cache=not args.no_cache,
+        stream=not args.no_stream,
+        max_inflight=args.max_inflight,
+        prefilter=not args.no_prefilter,
+        batch_size=args.batch_size
     )
     
     if args.test_connection:
@@ -933,8 +1741,19 @@ def main():
     elif args.interactive:
         if extractor.test_llm_connection():
             extractor.interactive_mode()
+    elif args.batch:
+        if extractor.test_llm_connection():
+            successful = extractor.batch_process(load_articles_jsonl(args.batch))
+            if log_level > logging.INFO:
+                print(f"✓ Successfully processed {successful} articles")
+    elif args.bulk:
+        if extractor.test_llm_connection():
+            successful = extractor.queue_mode(iter_articles_jsonl(args.bulk))
+            if log_level > logging.INFO:
+                print(f"✓ Successfully processed {successful} articles")
     else:
-        print("Use --interactive to start article processing or --test-connection to verify setup")
+        print("Use --interactive to start article processing, --batch FILE or --bulk FILE for JSONL input,")
+        print("or --test-connection to verify setup")
         print("Make sure LM Studio is running with a model loaded!")
 
 if __name__ == "__main__":